@@ -1,64 +1,209 @@
+from __future__ import annotations
+
+import re
+import sys
+import threading
+import time
 import tkinter as tk
+from array import array
+from collections import deque
+from concurrent.futures import Future
 from tkinter import messagebox
+from typing import NamedTuple
 
 # Custom Exceptions
 class BankingException(Exception):
     """Base class for banking exceptions"""
-    pass
 
 class InsufficientFundsError(BankingException):
     """Raised when account has insufficient funds"""
-    pass
 
 class InvalidAmountError(BankingException):
     """Raised when an invalid amount is entered"""
-    pass
 
 class InvalidChoiceError(BankingException):
     """Raised when an invalid menu choice is made"""
-    pass
 
 class InvalidAccountError(BankingException):
     """Raised when an invalid account is referenced"""
-    pass
+
+# Dollar amounts as entered by the user: up to 12 digits with up to two decimals
+_AMOUNT_RE = re.compile(r"\d{1,12}(?:\.\d{1,2})?")
+
+# Largest balance in cents that fits in a row of the "q" balance arrays
+_MAX_CENTS = 2**63 - 1
+
+def _to_cents(amount):
+    """
+    Convert a user-entered amount to integer cents
+    
+    Args:
+        amount (str): Amount in dollars, e.g. "12.50"
+        
+    Returns:
+        int: Amount in cents
+        
+    Raises:
+        InvalidAmountError: If amount is not a non-negative number
+            with at most 12 digits and two decimal places
+    """
+    if not isinstance(amount, str):
+        raise InvalidAmountError(f"Invalid amount: {amount!r}")
+    amount = amount.strip()
+    if not _AMOUNT_RE.fullmatch(amount):
+        raise InvalidAmountError(f"Invalid amount: {amount}")
+    dollars, _, cents = amount.partition(".")
+    return int(dollars) * 100 + int(cents.ljust(2, "0"))
+
+def _amount_in_cents(amount):
+    """Return amount in cents, converting it first if it is still user input"""
+    if isinstance(amount, int) and not isinstance(amount, bool):
+        return amount
+    if amount is None:
+        raise InvalidAmountError("Amount is required")
+    return _to_cents(amount)
+
+def _format_cents(cents: int) -> str:
+    """Format integer cents as a dollar string, e.g. 1050 -> "$10.50" """
+    sign = "-" if cents < 0 else ""
+    cents = abs(cents)
+    return f"{sign}${cents // 100}.{cents % 100:02d}"
 
 class BankAccount:
-    """Represents a bank account with basic operations"""
-    def __init__(self, account_number, account_holder, balance=0.0, mobile_balance=0.0):
+    """
+    Represents a bank account with basic operations
+    
+    Balances live in shared integer arrays (one row per account) owned by
+    the BankingApp; the account object is a view onto its row and reports
+    balance changes to the app, which keeps its running total and row
+    versions.
+    Accounts created directly get single-row arrays of their own. Once the
+    app closes, its accounts are unbound and raise InvalidAccountError.
+    """
+    __slots__ = ("account_number", "account_holder", "_balances", "_mobile", "_idx",
+                 "_owner", "_balance_str", "_mobile_str")
+    
+    account_number: str
+    account_holder: str
+    _balances: array[int] | None
+    _mobile: array[int] | None
+    _idx: int
+    _owner: BankingApp | None
+    _balance_str: str | None
+    _mobile_str: str | None
+
+    def __init__(self, account_number: str, account_holder: str,
+                 balance: int = 0, mobile_balance: int = 0) -> None:
         """
         Initialize a bank account
         
         Args:
             account_number (str): Unique account identifier
             account_holder (str): Account holder's name
-            balance (float): Initial account balance
-            mobile_balance (float): Initial mobile credit balance
+            balance (int): Initial account balance in cents
+            mobile_balance (int): Initial mobile credit balance in cents
+        """
+        self._bind(account_number, account_holder,
+                   array("q", [balance]), array("q", [mobile_balance]), 0)
+    
+    def _bind(self, account_number: str, account_holder: str,
+              balances: array[int], mobile_balances: array[int], idx: int,
+              owner: BankingApp | None = None) -> None:
+        """
+        Point the account at a row of the balance arrays
+        
+        Args:
+            account_number (str): Unique account identifier
+            account_holder (str): Account holder's name
+            balances (array): Account balances in cents
+            mobile_balances (array): Mobile credit balances in cents
+            idx (int): Row of this account in both arrays
+            owner (BankingApp): The BankingApp owning the arrays, if any
         """
         self.account_number = account_number
         self.account_holder = account_holder
-        self.balance = balance
-        self.mobile_balance = mobile_balance
+        self._balances = balances
+        self._mobile = mobile_balances
+        self._idx = idx
+        self._owner = owner
+        # Formatted balance strings, cleared whenever a balance changes
+        self._balance_str = None
+        self._mobile_str = None
+    
+    def _unbind(self) -> None:
+        """Detach the account from its balance arrays and owner"""
+        self._balances = None
+        self._mobile = None
+        self._owner = None
+        self._balance_str = None
+        self._mobile_str = None
+    
+    def _closed(self) -> InvalidAccountError:
+        """Error for using an account after its app was closed"""
+        return InvalidAccountError(f"Account {self.account_number} is closed")
     
-    def deposit(self, amount):
+    @property
+    def balance(self) -> int:
+        """Current account balance in cents"""
+        balances = self._balances
+        if balances is None:
+            raise self._closed()
+        return balances[self._idx]
+    
+    @balance.setter
+    def balance(self, value: int) -> None:
+        balances = self._balances
+        if balances is None:
+            raise self._closed()
+        delta = value - balances[self._idx]
+        balances[self._idx] = value
+        self._balance_str = None
+        owner = self._owner
+        if owner is not None:
+            owner._on_balance_change(self._idx, delta)
+    
+    @property
+    def mobile_balance(self) -> int:
+        """Current mobile credit balance in cents"""
+        mobile = self._mobile
+        if mobile is None:
+            raise self._closed()
+        return mobile[self._idx]
+    
+    @mobile_balance.setter
+    def mobile_balance(self, value: int) -> None:
+        mobile = self._mobile
+        if mobile is None:
+            raise self._closed()
+        mobile[self._idx] = value
+        self._mobile_str = None
+        owner = self._owner
+        if owner is not None:
+            owner._on_balance_change(self._idx, 0)
+    
+    def deposit(self, amount: int) -> None:
         """
         Deposit money into the account
         
         Args:
-            amount (float): Amount to deposit
+            amount (int): Amount to deposit in cents
             
         Raises:
-            InvalidAmountError: If amount is not positive
+            InvalidAmountError: If amount is not positive or the new balance
+                would be too large
         """
         if amount <= 0:
             raise InvalidAmountError("Deposit amount must be positive")
+        if amount > _MAX_CENTS - self.balance:
+            raise InvalidAmountError("Deposit would exceed the maximum balance")
         self.balance += amount
     
-    def withdraw(self, amount):
+    def withdraw(self, amount: int) -> None:
         """
         Withdraw money from the account
         
         Args:
-            amount (float): Amount to withdraw
+            amount (int): Amount to withdraw in cents
             
         Raises:
             InvalidAmountError: If amount is not positive
@@ -70,16 +215,17 @@ class BankAccount:
             raise InsufficientFundsError("Insufficient funds for withdrawal")
         self.balance -= amount
     
-    def transfer(self, target_account, amount):
+    def transfer(self, target_account: object, amount: int) -> None:
         """
         Transfer money to another account
         
         Args:
             target_account (BankAccount): Account to receive funds
-            amount (float): Amount to transfer
+            amount (int): Amount to transfer in cents
             
         Raises:
-            InvalidAmountError: If amount is not positive
+            InvalidAmountError: If amount is not positive or the target's
+                new balance would be too large
             InsufficientFundsError: If account has insufficient funds
             InvalidAccountError: If target account is invalid
         """
@@ -89,53 +235,217 @@ class BankAccount:
             raise InvalidAmountError("Transfer amount must be positive")
         if amount > self.balance:
             raise InsufficientFundsError("Insufficient funds for transfer")
+        if amount > _MAX_CENTS - target_account.balance:
+            raise InvalidAmountError("Transfer would exceed the target's maximum balance")
         
         self.balance -= amount
         target_account.balance += amount
     
-    def top_up_mobile(self, amount):
+    def top_up_mobile(self, amount: int) -> None:
         """
         Top up mobile credit from account balance
         
         Args:
-            amount (float): Amount to top up
+            amount (int): Amount to top up in cents
             
         Raises:
-            InvalidAmountError: If amount is not positive
+            InvalidAmountError: If amount is not positive or the new mobile
+                balance would be too large
             InsufficientFundsError: If account has insufficient funds
         """
         if amount <= 0:
             raise InvalidAmountError("Top-up amount must be positive")
         if amount > self.balance:
             raise InsufficientFundsError("Insufficient funds for mobile top-up")
+        if amount > _MAX_CENTS - self.mobile_balance:
+            raise InvalidAmountError("Top-up would exceed the maximum mobile balance")
         
         self.balance -= amount
         self.mobile_balance += amount
     
-    def get_balance(self):
-        """Get current account balance"""
+    def get_balance(self) -> int:
+        """Get current account balance in cents"""
         return self.balance
     
-    def get_mobile_balance(self):
-        """Get current mobile credit balance"""
+    def get_mobile_balance(self) -> int:
+        """Get current mobile credit balance in cents"""
         return self.mobile_balance
     
-    def __str__(self):
+    def formatted_balance(self) -> str:
+        """Get current account balance as a dollar string"""
+        if self._balance_str is None:
+            self._balance_str = _format_cents(self.balance)
+        return self._balance_str
+    
+    def formatted_mobile_balance(self) -> str:
+        """Get current mobile credit balance as a dollar string"""
+        if self._mobile_str is None:
+            self._mobile_str = _format_cents(self.mobile_balance)
+        return self._mobile_str
+    
+    def __str__(self) -> str:
         """String representation of account"""
         return (f"Account: {self.account_number}\n"
                 f"Holder: {self.account_holder}\n"
-                f"Balance: ${self.balance:.2f}\n"
-                f"Mobile Credit: ${self.mobile_balance:.2f}")
+                f"Balance: {self.formatted_balance()}\n"
+                f"Mobile Credit: {self.formatted_mobile_balance()}")
+
+# Default and largest number of released accounts a pool keeps
+_POOL_SIZE = 1024
+
+class BankAccountPool:
+    """
+    Keeps released BankAccount objects for reuse
+    
+    The pool starts empty and fills as accounts are released; acquire()
+    creates a new account whenever there is none to reuse.
+    """
+    def __init__(self, size=_POOL_SIZE):
+        """
+        Initialize an empty pool
+        
+        Args:
+            size (int): Maximum number of released accounts to keep
+        """
+        self._size = min(size, _POOL_SIZE)
+        # Unbound accounts; acquire() points them at their balance arrays
+        self._free = deque()
+    
+    def acquire(self, account_number, account_holder, balances, mobile_balances, idx,
+                owner=None):
+        """
+        Take an account from the pool and bind it to a row of balances
+        
+        Args:
+            account_number (str): Unique account identifier
+            account_holder (str): Account holder's name
+            balances (array): Account balances in cents
+            mobile_balances (array): Mobile credit balances in cents
+            idx (int): Row of the account in both arrays
+            owner (BankingApp): The BankingApp owning the arrays, if any
+            
+        Returns:
+            BankAccount: The initialized account object
+        """
+        account = self._free.pop() if self._free else BankAccount(account_number, account_holder)
+        account._bind(account_number, account_holder, balances, mobile_balances, idx, owner)
+        return account
+    
+    def release(self, account):
+        """
+        Unbind an account and return it to the pool
+        
+        Only release accounts nobody else holds: the pool hands them out
+        again, so a leftover reference would see the next account bound to
+        it. Accounts released while the pool is full are left to the
+        garbage collector.
+        
+        Args:
+            account (BankAccount): Account to return
+        """
+        account._unbind()
+        if len(self._free) < self._size:
+            self._free.append(account)
+
+# Shared by all BankingApp instances
+_account_pool = BankAccountPool()
+
+# Result messages for process_user_input; amounts are preformatted dollar strings
+_DEPOSIT_MSG = "Deposited %s. New balance: %s"
+_WITHDRAW_MSG = "Withdrew %s. New balance: %s"
+_BALANCE_MSG = "Account Balance: %s\nMobile Credit: %s"
+_TRANSFER_MSG = "Transferred %s to account %s\nNew balance: %s"
+_TOP_UP_MSG = "Topped up mobile with %s\nAccount Balance: %s\nMobile Credit: %s"
+
+# How long (seconds) a balance snapshot is reused before re-reading the account
+_BALANCE_CACHE_TTL = 0.1
+
+class _BalanceSnapshot(NamedTuple):
+    """Balances of an account read together, with their dollar strings"""
+    balance: int
+    mobile_balance: int
+    balance_str: str
+    mobile_str: str
 
 class BankingApp:
     """Handles core banking operations"""
     def __init__(self):
         """Initialize banking application with sample accounts"""
-        self.accounts = {
-            "1001": BankAccount("1001", "Alice Smith", 1000.0),
-            "1002": BankAccount("1002", "Bob Johnson", 1500.0),
-            "1003": BankAccount("1003", "Charlie Brown", 500.0)
+        # Balances in cents, one row per account in opening order
+        self._balances = array("q")
+        self._mobile = array("q")
+        # Bumped on every balance change, so snapshots can tell they are stale
+        self._versions = array("q")
+        # Sum of all account balances, kept up to date by _on_balance_change
+        self._total_balance = 0
+        self.accounts = {}
+        # Numbers of accounts handed out by get_account(); close() unbinds
+        # those instead of recycling them, since callers may still hold them
+        self._lent = set()
+        self._open_account(sys.intern("1001"), "Alice Smith", 100000)
+        self._open_account(sys.intern("1002"), "Bob Johnson", 150000)
+        self._open_account(sys.intern("1003"), "Charlie Brown", 50000)
+        self._handlers = {
+            "deposit": self._do_deposit,
+            "withdraw": self._do_withdraw,
+            "balance": self._do_balance,
+            "transfer": self._do_transfer,
+            "top_up": self._do_top_up
         }
+        # Balance snapshots: queries in flight and recently computed results
+        self._snapshot_lock = threading.Lock()
+        self._inflight = {}
+        self._snapshots = {}
+    
+    def _open_account(self, account_number, account_holder, balance=0, mobile_balance=0):
+        """
+        Add an account row to the balance arrays
+        
+        Args:
+            account_number (str): Unique account identifier
+            account_holder (str): Account holder's name
+            balance (int): Initial account balance in cents
+            mobile_balance (int): Initial mobile credit balance in cents
+            
+        Returns:
+            BankAccount: View onto the new row
+        """
+        idx = len(self._balances)
+        self._balances.append(balance)
+        self._mobile.append(mobile_balance)
+        self._versions.append(0)
+        self._total_balance += balance
+        account = _account_pool.acquire(account_number, account_holder,
+                                        self._balances, self._mobile, idx,
+                                        self)
+        self.accounts[account_number] = account
+        return account
+    
+    def close(self):
+        """Release all accounts back to the shared account pool"""
+        lent = self._lent
+        for account_number, account in self.accounts.items():
+            if account_number in lent:
+                account._unbind()
+            else:
+                _account_pool.release(account)
+        self.accounts.clear()
+        lent.clear()
+        del self._balances[:]
+        del self._mobile[:]
+        del self._versions[:]
+        self._total_balance = 0
+        with self._snapshot_lock:
+            self._snapshots.clear()
+    
+    def _on_balance_change(self, idx, delta):
+        """Record a change of delta cents to the balance of row idx"""
+        self._total_balance += delta
+        self._versions[idx] += 1
+    
+    def total_balance(self):
+        """Get the sum of all account balances in cents"""
+        return self._total_balance
     
     def get_account(self, account_number):
         """
@@ -150,19 +460,92 @@ class BankingApp:
         Raises:
             InvalidAccountError: If account doesn't exist
         """
+        account = self._find_account(account_number)
+        self._lent.add(account.account_number)
+        return account
+    
+    def _find_account(self, account_number):
+        """Look up an account for internal use, without lending it out"""
+        if not isinstance(account_number, str):
+            raise InvalidAccountError(f"Account {account_number} not found")
+        account_number = sys.intern(account_number)
         account = self.accounts.get(account_number)
         if not account:
             raise InvalidAccountError(f"Account {account_number} not found")
         return account
     
-    def process_user_input(self, choice, account_number, data):
+    def get_balance_snapshot(self, account_number):
+        """
+        Get the account and mobile credit balances of an account
+        
+        Concurrent calls for the same account share a single lookup, and
+        the result is reused for up to _BALANCE_CACHE_TTL seconds afterwards
+        unless the account changes in the meantime.
+        
+        Args:
+            account_number (str): Account number
+            
+        Returns:
+            tuple: (balance, mobile_balance) in cents
+            
+        Raises:
+            InvalidAccountError: If account doesn't exist
+        """
+        snapshot = self._balance_snapshot(self._find_account(account_number))
+        return snapshot.balance, snapshot.mobile_balance
+    
+    def _balance_snapshot(self, account):
+        """Get a _BalanceSnapshot of account, shared between concurrent callers"""
+        account_number = account.account_number
+        versions = self._versions
+        idx = account._idx
+        with self._snapshot_lock:
+            cached = self._snapshots.get(account_number)
+            if (cached is not None and cached[0] > time.monotonic()
+                    and cached[1] == versions[idx]):
+                return cached[2]
+            future = self._inflight.get(account_number)
+            if future is not None:
+                leader = False
+            else:
+                leader = True
+                future = self._inflight[account_number] = Future()
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            version = versions[idx]
+            balance = account.balance
+            mobile_balance = account.mobile_balance
+            # Format the values just read: the account's own string cache can
+            # be refilled with an old value by a concurrent change
+            snapshot = _BalanceSnapshot(balance, mobile_balance,
+                                        _format_cents(balance), _format_cents(mobile_balance))
+        except BaseException as e:
+            with self._snapshot_lock:
+                del self._inflight[account_number]
+            future.set_exception(e)
+            raise
+        
+        with self._snapshot_lock:
+            # A change made while reading bumped the version; don't keep it
+            if versions[idx] == version:
+                self._snapshots[account_number] = (
+                    time.monotonic() + _BALANCE_CACHE_TTL, version, snapshot)
+            del self._inflight[account_number]
+        future.set_result(snapshot)
+        return snapshot
+    
+    def process_user_input(self, choice, account_number, *, amount=None, target_account=None):
         """
         Process user banking operations
         
         Args:
             choice (str): Menu choice
             account_number (str): Account to operate on
-            data (dict): Additional operation data
+            amount (str or int): Amount as user input or integer cents
+            target_account (str): Account to receive a transfer
             
         Returns:
             str: Operation result message
@@ -170,38 +553,47 @@ class BankingApp:
         Raises:
             BankingException: For any banking errors
         """
-        account = self.get_account(account_number)
-        
-        if choice == "deposit":
-            amount = float(data["amount"])
-            account.deposit(amount)
-            return f"Deposited ${amount:.2f}. New balance: ${account.balance:.2f}"
-        
-        elif choice == "withdraw":
-            amount = float(data["amount"])
-            account.withdraw(amount)
-            return f"Withdrew ${amount:.2f}. New balance: ${account.balance:.2f}"
-        
-        elif choice == "balance":
-            return (f"Account Balance: ${account.balance:.2f}\n"
-                    f"Mobile Credit: ${account.mobile_balance:.2f}")
-        
-        elif choice == "transfer":
-            target_account = self.get_account(data["target_account"])
-            amount = float(data["amount"])
-            account.transfer(target_account, amount)
-            return (f"Transferred ${amount:.2f} to account {target_account.account_number}\n"
-                    f"New balance: ${account.balance:.2f}")
-        
-        elif choice == "top_up":
-            amount = float(data["amount"])
-            account.top_up_mobile(amount)
-            return (f"Topped up mobile with ${amount:.2f}\n"
-                    f"Account Balance: ${account.balance:.2f}\n"
-                    f"Mobile Credit: ${account.mobile_balance:.2f}")
-        
-        else:
+        handler = self._handlers.get(choice)
+        if handler is None:
             raise InvalidChoiceError("Invalid operation choice")
+        return handler(self._find_account(account_number), amount, target_account)
+    
+    def _do_deposit(self, account, amount, target_account):
+        """Deposit into account and describe the result"""
+        amount = _amount_in_cents(amount)
+        account.deposit(amount)
+        return _DEPOSIT_MSG % (_format_cents(amount), account.formatted_balance())
+    
+    def _do_withdraw(self, account, amount, target_account):
+        """Withdraw from account and describe the result"""
+        amount = _amount_in_cents(amount)
+        account.withdraw(amount)
+        return _WITHDRAW_MSG % (_format_cents(amount), account.formatted_balance())
+    
+    def _do_balance(self, account, amount, target_account):
+        """Describe the account and mobile credit balances"""
+        snapshot = self._balance_snapshot(account)
+        return _BALANCE_MSG % (snapshot.balance_str, snapshot.mobile_str)
+    
+    def _do_transfer(self, account, amount, target_account):
+        """Transfer to the target account and describe the result"""
+        if not target_account:
+            raise InvalidAccountError("Target account is required")
+        target_account = self._find_account(target_account)
+        amount = _amount_in_cents(amount)
+        account.transfer(target_account, amount)
+        return _TRANSFER_MSG % (_format_cents(amount), target_account.account_number,
+                                account.formatted_balance())
+    
+    def _do_top_up(self, account, amount, target_account):
+        """Top up mobile credit and describe the result"""
+        amount = _amount_in_cents(amount)
+        account.top_up_mobile(amount)
+        return _TOP_UP_MSG % (_format_cents(amount), account.formatted_balance(),
+                              account.formatted_mobile_balance())
+
+# Operations whose amount the GUI converts to cents before processing
+_AMOUNT_OPERATIONS = frozenset(("deposit", "withdraw", "transfer", "top_up"))
 
 class BankingGUI:
     """Provides a graphical interface for banking operations"""
@@ -226,10 +618,12 @@ class BankingGUI:
         self.account_entry = tk.Entry(self.root)
         self.account_entry.grid(row=0, column=1, padx=5, pady=5)
         self.account_entry.insert(0, "1001")
+        self._get_account = self.account_entry.get
         
         # Operation selection
         tk.Label(self.root, text="Operation:").grid(row=1, column=0, padx=5, pady=5)
         self.operation_var = tk.StringVar(value="balance")
+        self._get_operation = self.operation_var.get
         operations = [
             ("Check Balance", "balance"),
             ("Deposit", "deposit"),
@@ -251,11 +645,13 @@ class BankingGUI:
         tk.Label(self.root, text="Amount:").grid(row=7, column=0, padx=5, pady=5)
         self.amount_entry = tk.Entry(self.root)
         self.amount_entry.grid(row=7, column=1, padx=5, pady=5)
+        self._get_amount = self.amount_entry.get
         
         # Target account for transfer
         tk.Label(self.root, text="Target Account:").grid(row=8, column=0, padx=5, pady=5)
         self.target_entry = tk.Entry(self.root)
         self.target_entry.grid(row=8, column=1, padx=5, pady=5)
+        self._get_target = self.target_entry.get
         
         # Execute button
         self.execute_btn = tk.Button(
@@ -269,26 +665,29 @@ class BankingGUI:
         self.result_text = tk.Text(self.root, height=10, width=40)
         self.result_text.grid(row=10, column=0, columnspan=2, padx=5, pady=5)
         self.result_text.config(state=tk.DISABLED)
+        self._config_result = self.result_text.config
+        self._insert_result = self.result_text.insert
+        self._delete_result = self.result_text.delete
     
     def execute_operation(self):
         """Execute the selected banking operation"""
-        account_number = self.account_entry.get()
-        operation = self.operation_var.get()
-        amount = self.amount_entry.get()
-        target_account = self.target_entry.get()
-        
-        # Prepare data dictionary
-        data = {
-            "amount": amount,
-            "target_account": target_account
-        }
+        account_number = self._get_account()
+        operation = self._get_operation()
+        amount = self._get_amount()
+        target_account = self._get_target()
         
         try:
+            # Validate the amount and convert it to cents once, up front;
+            # unknown operations are left for process_user_input to reject
+            if operation in _AMOUNT_OPERATIONS:
+                amount = _to_cents(amount)
+            
             # Process the operation
             result = self.banking_app.process_user_input(
                 operation, 
                 account_number, 
-                data
+                amount=amount,
+                target_account=target_account
             )
             self.show_result(result)
         except BankingException as e:
@@ -296,10 +695,10 @@ class BankingGUI:
     
     def show_result(self, message):
         """Display operation result"""
-        self.result_text.config(state=tk.NORMAL)
-        self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(tk.END, message)
-        self.result_text.config(state=tk.DISABLED)
+        self._config_result(state=tk.NORMAL)
+        self._delete_result(1.0, tk.END)
+        self._insert_result(tk.END, message)
+        self._config_result(state=tk.DISABLED)
     
     def show_error(self, error_message):
         """Display error message"""
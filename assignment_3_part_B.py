@@ -1,22 +1,31 @@
+import threading
 import unittest
-from banking_app import BankAccount, BankingApp, InsufficientFundsError, InvalidAmountError, InvalidAccountError
+from array import array
+from concurrent.futures import Future
+from unittest import mock
+import banking_app
+from banking_app import _account_pool, _format_cents, _POOL_SIZE, BankAccount, BankAccountPool, BankingApp, InsufficientFundsError, InvalidAmountError, InvalidAccountError, InvalidChoiceError
+
+# Built with mypyc (see build_mypyc.py); compiled code calls module
+# functions directly, so patching them has no effect
+COMPILED = not banking_app.__file__.endswith(".py")
 
 class TestBankAccount(unittest.TestCase):
     """Tests for BankAccount class"""
     
     def setUp(self):
         """Set up a test account"""
-        self.account = BankAccount("12345", "Test User", 1000.0)
+        self.account = BankAccount("12345", "Test User", 100000)
     
     def test_deposit_valid(self):
         """Test valid deposit"""
-        self.account.deposit(500)
-        self.assertEqual(self.account.balance, 1500.0)
+        self.account.deposit(50000)
+        self.assertEqual(self.account.balance, 150000)
     
     def test_deposit_negative(self):
         """Test negative deposit amount"""
         with self.assertRaises(InvalidAmountError):
-            self.account.deposit(-100)
+            self.account.deposit(-10000)
     
     def test_deposit_zero(self):
         """Test zero deposit amount"""
@@ -25,52 +34,97 @@ class TestBankAccount(unittest.TestCase):
     
     def test_withdraw_valid(self):
         """Test valid withdrawal"""
-        self.account.withdraw(500)
-        self.assertEqual(self.account.balance, 500.0)
+        self.account.withdraw(50000)
+        self.assertEqual(self.account.balance, 50000)
     
     def test_withdraw_insufficient_funds(self):
         """Test withdrawal with insufficient funds"""
         with self.assertRaises(InsufficientFundsError):
-            self.account.withdraw(1500)
+            self.account.withdraw(150000)
     
     def test_withdraw_negative(self):
         """Test negative withdrawal amount"""
         with self.assertRaises(InvalidAmountError):
-            self.account.withdraw(-100)
+            self.account.withdraw(-10000)
     
     def test_transfer_valid(self):
         """Test valid transfer"""
-        target = BankAccount("67890", "Target User", 500.0)
-        self.account.transfer(target, 300)
-        self.assertEqual(self.account.balance, 700.0)
-        self.assertEqual(target.balance, 800.0)
+        target = BankAccount("67890", "Target User", 50000)
+        self.account.transfer(target, 30000)
+        self.assertEqual(self.account.balance, 70000)
+        self.assertEqual(target.balance, 80000)
     
     def test_transfer_insufficient_funds(self):
         """Test transfer with insufficient funds"""
-        target = BankAccount("67890", "Target User", 500.0)
+        target = BankAccount("67890", "Target User", 50000)
         with self.assertRaises(InsufficientFundsError):
-            self.account.transfer(target, 1500)
+            self.account.transfer(target, 150000)
     
     def test_transfer_invalid_account(self):
         """Test transfer to invalid account"""
         with self.assertRaises(InvalidAccountError):
-            self.account.transfer("not_an_account", 100)
+            self.account.transfer("not_an_account", 10000)
+    
+    def test_deposit_overflowing_balance(self):
+        """Test deposit that would overflow the balance"""
+        with self.assertRaises(InvalidAmountError):
+            self.account.deposit(2**63)
+        self.assertEqual(self.account.balance, 100000)
+    
+    def test_transfer_overflowing_target(self):
+        """Test transfer that would overflow the target leaves both balances"""
+        target = BankAccount("67890", "Target User", 2**63 - 1)
+        with self.assertRaises(InvalidAmountError):
+            self.account.transfer(target, 50000)
+        self.assertEqual(self.account.balance, 100000)
+        self.assertEqual(target.balance, 2**63 - 1)
     
     def test_top_up_valid(self):
         """Test valid mobile top-up"""
-        self.account.top_up_mobile(100)
-        self.assertEqual(self.account.balance, 900.0)
-        self.assertEqual(self.account.mobile_balance, 100.0)
+        self.account.top_up_mobile(10000)
+        self.assertEqual(self.account.balance, 90000)
+        self.assertEqual(self.account.mobile_balance, 10000)
     
     def test_top_up_insufficient_funds(self):
         """Test top-up with insufficient funds"""
         with self.assertRaises(InsufficientFundsError):
-            self.account.top_up_mobile(1500)
+            self.account.top_up_mobile(150000)
     
     def test_top_up_negative(self):
         """Test negative top-up amount"""
         with self.assertRaises(InvalidAmountError):
-            self.account.top_up_mobile(-100)
+            self.account.top_up_mobile(-10000)
+    
+    def test_top_up_overflowing_mobile_balance(self):
+        """Test top-up that would overflow the mobile balance leaves both balances"""
+        account = BankAccount("67890", "Target User", 100000, 2**63 - 1)
+        with self.assertRaises(InvalidAmountError):
+            account.top_up_mobile(50000)
+        self.assertEqual(account.balance, 100000)
+        self.assertEqual(account.mobile_balance, 2**63 - 1)
+    
+    def test_formatted_balance_refreshes(self):
+        """Test formatted balances follow balance changes"""
+        self.assertEqual(self.account.formatted_balance(), "$1000.00")
+        self.account.top_up_mobile(2550)
+        self.assertEqual(self.account.formatted_balance(), "$974.50")
+        self.assertEqual(self.account.formatted_mobile_balance(), "$25.50")
+    
+    def test_formatted_balance_refreshes_on_transfer(self):
+        """Test transfer refreshes the target's formatted balance"""
+        target = BankAccount("67890", "Target User", 50000)
+        self.assertEqual(target.formatted_balance(), "$500.00")
+        self.account.transfer(target, 30000)
+        self.assertEqual(target.formatted_balance(), "$800.00")
+    
+    def test_formatted_balance_refreshes_on_assignment(self):
+        """Test assigning balances directly refreshes formatted balances"""
+        self.assertEqual(self.account.formatted_balance(), "$1000.00")
+        self.assertEqual(self.account.formatted_mobile_balance(), "$0.00")
+        self.account.balance = 5
+        self.account.mobile_balance = 250
+        self.assertEqual(self.account.formatted_balance(), "$0.05")
+        self.assertEqual(self.account.formatted_mobile_balance(), "$2.50")
 
 class TestBankingApp(unittest.TestCase):
     """Tests for BankingApp class"""
@@ -78,6 +132,7 @@ class TestBankingApp(unittest.TestCase):
     def setUp(self):
         """Set up banking app with test accounts"""
         self.app = BankingApp()
+        self.addCleanup(self.app.close)
     
     def test_get_valid_account(self):
         """Test retrieving valid account"""
@@ -89,44 +144,101 @@ class TestBankingApp(unittest.TestCase):
         with self.assertRaises(InvalidAccountError):
             self.app.get_account("9999")
     
+    def test_get_non_string_account(self):
+        """Test retrieving account with a non-string number"""
+        with self.assertRaises(InvalidAccountError):
+            self.app.get_account(None)
+        with self.assertRaises(InvalidAccountError):
+            self.app.get_account(1001)
+    
     def test_process_deposit(self):
         """Test processing valid deposit"""
-        result = self.app.process_user_input("deposit", "1001", {"amount": "500"})
+        result = self.app.process_user_input("deposit", "1001", amount="500")
         self.assertIn("Deposited $500.00", result)
         self.assertIn("$1500.00", result)
     
     def test_process_invalid_deposit(self):
         """Test processing invalid deposit"""
         with self.assertRaises(InvalidAmountError):
-            self.app.process_user_input("deposit", "1001", {"amount": "-100"})
+            self.app.process_user_input("deposit", "1001", amount="-100")
+    
+    def test_process_deposit_cents(self):
+        """Test deposits of fractional amounts add up exactly"""
+        self.app.process_user_input("deposit", "1001", amount="0.10")
+        result = self.app.process_user_input("deposit", "1001", amount="0.20")
+        self.assertIn("New balance: $1000.30", result)
+        self.assertEqual(self.app.get_account("1001").balance, 100030)
+    
+    def test_process_non_numeric_amount(self):
+        """Test processing a non-numeric amount"""
+        with self.assertRaises(InvalidAmountError):
+            self.app.process_user_input("deposit", "1001", amount="abc")
+    
+    def test_process_too_many_decimals(self):
+        """Test processing an amount with more than two decimal places"""
+        with self.assertRaises(InvalidAmountError):
+            self.app.process_user_input("deposit", "1001", amount="1.005")
+    
+    def test_process_non_string_amount(self):
+        """Test processing amounts that are neither text nor cents"""
+        for amount in (5.0, True, [500]):
+            with self.subTest(amount=amount):
+                with self.assertRaises(InvalidAmountError):
+                    self.app.process_user_input("deposit", "1001", amount=amount)
+        self.assertEqual(self.app.get_account("1001").balance, 100000)
+    
+    def test_process_amount_too_large(self):
+        """Test processing an amount with too many digits"""
+        with self.assertRaises(InvalidAmountError):
+            self.app.process_user_input("deposit", "1001", amount="99999999999999999999")
+        self.assertEqual(self.app.get_account("1001").balance, 100000)
+    
+    def test_process_amount_in_cents(self):
+        """Test processing an amount already converted to cents"""
+        result = self.app.process_user_input("deposit", "1001", amount=1050)
+        self.assertIn("Deposited $10.50", result)
     
     def test_process_withdraw(self):
         """Test processing valid withdrawal"""
-        result = self.app.process_user_input("withdraw", "1001", {"amount": "500"})
+        result = self.app.process_user_input("withdraw", "1001", amount="500")
         self.assertIn("Withdrew $500.00", result)
         self.assertIn("$500.00", result)
     
     def test_process_invalid_withdraw(self):
         """Test processing invalid withdrawal"""
         with self.assertRaises(InsufficientFundsError):
-            self.app.process_user_input("withdraw", "1001", {"amount": "2000"})
+            self.app.process_user_input("withdraw", "1001", amount="2000")
     
     def test_process_transfer(self):
         """Test processing valid transfer"""
-        data = {"amount": "300", "target_account": "1002"}
-        result = self.app.process_user_input("transfer", "1001", data)
+        result = self.app.process_user_input("transfer", "1001", amount="300", target_account="1002")
         self.assertIn("Transferred $300.00 to account 1002", result)
         self.assertIn("$700.00", result)
     
     def test_process_invalid_transfer(self):
         """Test processing invalid transfer"""
-        data = {"amount": "2000", "target_account": "1002"}
         with self.assertRaises(InsufficientFundsError):
-            self.app.process_user_input("transfer", "1001", data)
+            self.app.process_user_input("transfer", "1001", amount="2000", target_account="1002")
+    
+    def test_process_transfer_missing_target(self):
+        """Test processing transfer without a target account"""
+        with self.assertRaises(InvalidAccountError):
+            self.app.process_user_input("transfer", "1001", amount="300")
+    
+    def test_process_transfer_non_string_target(self):
+        """Test processing transfer to a non-string target account"""
+        with self.assertRaises(InvalidAccountError):
+            self.app.process_user_input("transfer", "1001", amount="1", target_account=1002)
+        self.assertEqual(self.app.get_account("1001").balance, 100000)
+    
+    def test_process_missing_amount(self):
+        """Test processing deposit without an amount"""
+        with self.assertRaises(InvalidAmountError):
+            self.app.process_user_input("deposit", "1001")
     
     def test_process_top_up(self):
         """Test processing valid mobile top-up"""
-        result = self.app.process_user_input("top_up", "1001", {"amount": "100"})
+        result = self.app.process_user_input("top_up", "1001", amount="100")
         self.assertIn("Topped up mobile with $100.00", result)
         self.assertIn("Account Balance: $900.00", result)
         self.assertIn("Mobile Credit: $100.00", result)
@@ -134,12 +246,184 @@ class TestBankingApp(unittest.TestCase):
     def test_process_invalid_top_up(self):
         """Test processing invalid mobile top-up"""
         with self.assertRaises(InsufficientFundsError):
-            self.app.process_user_input("top_up", "1001", {"amount": "2000"})
+            self.app.process_user_input("top_up", "1001", amount="2000")
+    
+    def test_process_balance(self):
+        """Test processing balance query"""
+        result = self.app.process_user_input("balance", "1001")
+        self.assertIn("Account Balance: $1000.00", result)
+        self.assertIn("Mobile Credit: $0.00", result)
+    
+    def test_balance_snapshot_after_deposit(self):
+        """Test balance snapshot reflects a processed deposit"""
+        self.assertEqual(self.app.get_balance_snapshot("1001"), (100000, 0))
+        self.app.process_user_input("deposit", "1001", amount="500")
+        self.assertEqual(self.app.get_balance_snapshot("1001"), (150000, 0))
+    
+    def test_balance_snapshot_after_direct_deposit(self):
+        """Test balance snapshot reflects a deposit made on the account object"""
+        self.assertEqual(self.app.get_balance_snapshot("1001"), (100000, 0))
+        self.app.get_account("1001").deposit(12345)
+        result = self.app.process_user_input("balance", "1001")
+        self.assertIn("Account Balance: $1123.45", result)
+    
+    @unittest.skipIf(COMPILED, "patches module functions")
+    def test_balance_snapshot_not_cached_across_concurrent_change(self):
+        """Test a snapshot read while the account changes is not reused"""
+        account = self.app.get_account("1001")
+        deposits = []
+        def format_during_deposit(cents):
+            if not deposits:
+                deposits.append(cents)
+                account.deposit(50000)
+            return _format_cents(cents)
+        with mock.patch("banking_app._format_cents", format_during_deposit):
+            self.assertEqual(self.app.get_balance_snapshot("1001"), (100000, 0))
+        self.assertEqual(self.app.get_balance_snapshot("1001"), (150000, 0))
+        self.assertIn("Account Balance: $1500.00",
+                      self.app.process_user_input("balance", "1001"))
+    
+    @unittest.skipIf(COMPILED, "patches module functions")
+    def test_balance_snapshot_coalesces_concurrent_queries(self):
+        """Test concurrent balance queries share a single lookup"""
+        followers = 3
+        waiting = threading.Semaphore(0)
+        reads = []
+        
+        class TrackedFuture(Future):
+            def result(self, timeout=None):
+                waiting.release()
+                return super().result(timeout)
+        
+        def format_after_followers(cents):
+            if not reads:
+                for _ in range(followers):
+                    self.assertTrue(waiting.acquire(timeout=5))
+            reads.append(cents)
+            return _format_cents(cents)
+        
+        results = []
+        def query():
+            results.append(self.app.get_balance_snapshot("1001"))
+        with mock.patch("banking_app.Future", TrackedFuture), \
+                mock.patch("banking_app._format_cents", format_after_followers):
+            threads = [threading.Thread(target=query) for _ in range(followers + 1)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+        # One leader formatted both balances; the followers shared its result
+        self.assertEqual(reads, [100000, 0])
+        self.assertEqual(results, [(100000, 0)] * (followers + 1))
+    
+    def test_balance_snapshot_invalid_account(self):
+        """Test balance snapshot of invalid account"""
+        with self.assertRaises(InvalidAccountError):
+            self.app.get_balance_snapshot("9999")
+        with self.assertRaises(InvalidAccountError):
+            self.app.get_balance_snapshot("9999")
+    
+    def test_total_balance(self):
+        """Test total balance follows processed operations"""
+        self.assertEqual(self.app.total_balance(), 300000)
+        self.app.process_user_input("deposit", "1001", amount="500")
+        self.assertEqual(self.app.total_balance(), 350000)
+        self.app.process_user_input("transfer", "1001", amount="300", target_account="1002")
+        self.assertEqual(self.app.total_balance(), 350000)
+        self.app.process_user_input("top_up", "1003", amount="100")
+        self.assertEqual(self.app.total_balance(), 340000)
+    
+    def test_total_balance_direct_account_changes(self):
+        """Test total balance follows changes made on account objects"""
+        account = self.app.get_account("1002")
+        account.withdraw(50000)
+        account.transfer(BankAccount("67890", "Outside User"), 10000)
+        self.assertEqual(self.app.total_balance(), 240000)
+        self.assertEqual(self.app.total_balance(), sum(
+            a.balance for a in self.app.accounts.values()))
+    
+    def test_close_unbinds_accounts(self):
+        """Test accounts held past close() fail instead of aliasing new ones"""
+        account = self.app.get_account("1001")
+        self.app.close()
+        other = BankingApp()
+        self.addCleanup(other.close)
+        with self.assertRaises(InvalidAccountError):
+            account.withdraw(100)
+        self.assertIsNot(other.get_account("1001"), account)
+        self.assertEqual(other.total_balance(), 300000)
+    
+    def test_close_recycles_unlent_accounts(self):
+        """Test close() returns accounts never handed out to the pool"""
+        app = BankingApp()
+        app.get_account("1001")
+        free = len(_account_pool._free)
+        app.close()
+        self.assertEqual(len(_account_pool._free), min(free + 2, _POOL_SIZE))
     
     def test_process_invalid_choice(self):
         """Test processing invalid menu choice"""
         with self.assertRaises(InvalidChoiceError):
-            self.app.process_user_input("invalid_choice", "1001", {})
+            self.app.process_user_input("invalid_choice", "1001")
+
+class TestBankAccountPool(unittest.TestCase):
+    """Tests for BankAccountPool class"""
+    
+    def setUp(self):
+        """Set up a small account pool and balance arrays"""
+        self.pool = BankAccountPool(size=2)
+        self.balances = array("q", [100000, 50000, 1000])
+        self.mobile = array("q", [5000, 0, 0])
+    
+    def test_acquire_initializes_account(self):
+        """Test acquired account is bound to its balance row"""
+        account = self.pool.acquire("12345", "Test User", self.balances, self.mobile, 0)
+        self.assertEqual(account.account_number, "12345")
+        self.assertEqual(account.account_holder, "Test User")
+        self.assertEqual(account.balance, 100000)
+        self.assertEqual(account.mobile_balance, 5000)
+    
+    def test_account_writes_through_to_arrays(self):
+        """Test account operations update the shared balance arrays"""
+        account = self.pool.acquire("12345", "Test User", self.balances, self.mobile, 0)
+        target = self.pool.acquire("67890", "Target User", self.balances, self.mobile, 1)
+        account.transfer(target, 30000)
+        account.top_up_mobile(1000)
+        self.assertEqual(list(self.balances), [69000, 80000, 1000])
+        self.assertEqual(list(self.mobile), [6000, 0, 0])
+    
+    def test_release_reuses_account(self):
+        """Test an unreferenced released account is handed out again"""
+        self.pool.release(self.pool.acquire("12345", "Test User", self.balances, self.mobile, 0))
+        self.assertEqual(len(self.pool._free), 1)
+        reused = self.pool.acquire("67890", "Other User", self.balances, self.mobile, 1)
+        self.assertEqual(len(self.pool._free), 0)
+        self.assertEqual(reused.account_number, "67890")
+        self.assertEqual(reused.balance, 50000)
+    
+    def test_release_unbinds_account(self):
+        """Test a released account is unbound without touching its balances"""
+        account = self.pool.acquire("12345", "Test User", self.balances, self.mobile, 0)
+        self.pool.release(account)
+        self.assertEqual(list(self.balances), [100000, 50000, 1000])
+        self.assertEqual(list(self.mobile), [5000, 0, 0])
+        with self.assertRaises(InvalidAccountError):
+            account.withdraw(100)
+    
+    def test_release_into_full_pool(self):
+        """Test accounts released into a full pool are dropped"""
+        accounts = [self.pool.acquire(str(idx), "User", self.balances, self.mobile, idx)
+                    for idx in range(3)]
+        for account in accounts:
+            self.pool.release(account)
+        self.assertEqual(len(self.pool._free), 2)
+    
+    def test_acquire_from_empty_pool(self):
+        """Test acquiring from an exhausted pool creates a new account"""
+        self.pool.acquire("1", "A", self.balances, self.mobile, 0)
+        self.pool.acquire("2", "B", self.balances, self.mobile, 1)
+        account = self.pool.acquire("3", "C", self.balances, self.mobile, 2)
+        self.assertEqual(account.balance, 1000)
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
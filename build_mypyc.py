@@ -0,0 +1,37 @@
+"""
+Compile the banking module with mypyc and run the tests against the result
+
+The tests import the module as banking_app, so both files are copied into
+a scratch directory under that name before compiling.
+
+Usage:
+    pip install mypy
+    python build_mypyc.py [build_dir]
+"""
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+def main():
+    """Build banking_app with mypyc and run the test suite against it"""
+    build_dir = Path(sys.argv[1] if len(sys.argv) > 1 else tempfile.mkdtemp())
+    build_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copy(HERE / "Assignment_3_part_A.py", build_dir / "banking_app.py")
+    shutil.copy(HERE / "assignment_3_part_B.py", build_dir / "assignment_3_part_B.py")
+    
+    subprocess.run([sys.executable, "-m", "mypyc", "banking_app.py"],
+                   cwd=build_dir, check=True)
+    # Leave only the extension module importable
+    (build_dir / "banking_app.py").unlink()
+    
+    print(f"Running tests against the compiled module in {build_dir}")
+    result = subprocess.run([sys.executable, "-m", "unittest", "-v", "assignment_3_part_B"],
+                            cwd=build_dir)
+    sys.exit(result.returncode)
+
+if __name__ == "__main__":
+    main()